@@ -24,17 +24,24 @@ from __future__ import annotations
 __version__ = "0.1.0"
 
 import argparse
+import codecs
+import copy
 import csv
+import functools
+import hashlib
 import io
 import json
 import logging
 import os
 import re
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 # Optional dependencies
 try:
@@ -42,28 +49,98 @@ try:
 except Exception:  # pragma: no cover - optional
     keyring = None  # type: ignore
 
+# Fast JSON: orjson when installed (2-10x faster parse/serialize, emits
+# bytes directly), stdlib json otherwise. Both helpers accept/produce bytes.
 try:
-    import chardet  # type: ignore
-except Exception:  # pragma: no cover - optional
-    chardet = None  # type: ignore
+    import orjson  # type: ignore
 
-try:
-    import tweepy  # type: ignore
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps_bytes(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
 except Exception:  # pragma: no cover - optional
-    tweepy = None  # type: ignore
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps_bytes(obj, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+@functools.lru_cache(maxsize=1)
+def _chardet():
+    """Import an encoding detector on first use (optional).
+
+    Prefers C-backed cchardet, then charset-normalizer (both expose a
+    chardet-compatible detect()), then pure-Python chardet.
+    """
+    try:
+        import cchardet as chardet  # type: ignore
+        return chardet
+    except Exception:  # pragma: no cover - optional
+        pass
+    try:
+        import charset_normalizer as chardet  # type: ignore
+        return chardet
+    except Exception:
+        pass
+    try:
+        import chardet  # type: ignore
+        return chardet
+    except Exception:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _tweepy():
+    """Import tweepy on first use (optional; only needed for real posting)."""
+    try:
+        import tweepy  # type: ignore
+        return tweepy
+    except Exception:  # pragma: no cover - optional
+        return None
+
+
+def _gui_invocation() -> bool:
+    # CLI-only runs (--file given, no --gui) never touch Qt, and importing
+    # PySide6 is the dominant cold-start cost. When in doubt, import it.
+    argv = sys.argv[1:]
+    if any(a == "--gui" for a in argv):
+        return True
+    return not any(a == "--file" or a.startswith("--file=") for a in argv)
+
 
 # GUI (optional)
-try:
-    from PySide6 import QtCore, QtGui, QtWidgets  # type: ignore
-except Exception:  # pragma: no cover - optional
+if _gui_invocation():
+    try:
+        from PySide6 import QtCore, QtGui, QtWidgets  # type: ignore
+    except Exception:  # pragma: no cover - optional
+        QtCore = QtGui = QtWidgets = None  # type: ignore
+else:
     QtCore = QtGui = QtWidgets = None  # type: ignore
 
 APP_NAME = "TweetyPy"
 DEFAULT_MAX_TWEET_LEN = 280
 
+# Jumps to the next non-whitespace char in one C call (splitter hot path)
+_NON_WS_RE = re.compile(r"\S")
+
+# Matches \r\n and bare \r so newline normalization is one pass; a
+# translate table can't do this (it would turn \r\n into \n\n)
+_LINE_BREAK_RE = re.compile(r"\r\n?")
+
+# Session-naming patterns, compiled once (hit via the autosave path)
+_RE_SENT_END = re.compile(r"[.!?]")
+_RE_WS = re.compile(r"\s+")
+_RE_UNSAFE = re.compile(r"[^A-Za-z0-9 _-]")
 
+
+@functools.lru_cache(maxsize=1)
 def get_app_dir() -> Path:
     # Prefer Windows APPDATA, else fallback to ~/.config/TweetyPy
+    # Cached: the result is process-constant and callers hit this on every
+    # startup path (logging, config, history); caching skips the repeated
+    # env lookup and mkdir stat.
     appdata = os.environ.get("APPDATA")
     if appdata:
         base = Path(appdata)
@@ -112,46 +189,80 @@ class ConfigManager:
         "access_token_secret",
     ]
 
+    # In-memory cache of the merged config/secrets dict. Keyring lookups can
+    # take 100+ ms each, so load() only does real work when the backing files
+    # change (or after a save() invalidates the cache).
+    _cache: Optional[dict] = None
+    _cache_stamp: Tuple[int, int] = (0, 0)
+    _cache_lock = threading.RLock()
+
+    # Process-lifetime mirror of config.json (non-sensitive settings only).
+    # High-frequency writers (checkbox toggles, window-state saves) mutate
+    # this dict and call schedule_flush() so each burst costs one JSON dump
+    # and one write instead of a read+parse+dump+write per event.
+    cache: dict = {}
+    _cache_loaded = False
+    _flush_timer = None  # lazily created QTimer when a Qt event loop exists
+
     @staticmethod
-    def _dpapi_protect(data: bytes) -> bytes:
+    @functools.lru_cache(maxsize=1)
+    def _dpapi():
+        """Resolve the crypt32 DPAPI entry points once (Windows only).
+
+        Returns (ctypes, DATA_BLOB, CryptProtectData, CryptUnprotectData) or
+        None when unavailable. Defining the DATA_BLOB structure and looking
+        up / typing the C functions per call was pure overhead, and declared
+        argtypes let ctypes skip signature inference on each invocation.
+        """
         try:
             import ctypes
             import ctypes.wintypes as wt
+
             class DATA_BLOB(ctypes.Structure):
                 _fields_ = [("cbData", wt.DWORD), ("pbData", ctypes.POINTER(ctypes.c_char))]
-            CryptProtectData = ctypes.windll.crypt32.CryptProtectData
-            CryptUnprotectData = ctypes.windll.crypt32.CryptUnprotectData  # noqa: F401
+
+            blob_p = ctypes.POINTER(DATA_BLOB)
+            protect = ctypes.windll.crypt32.CryptProtectData
+            unprotect = ctypes.windll.crypt32.CryptUnprotectData
+            for fn in (protect, unprotect):
+                fn.argtypes = [blob_p, wt.LPCWSTR, blob_p, ctypes.c_void_p,
+                               ctypes.c_void_p, wt.DWORD, blob_p]
+                fn.restype = wt.BOOL
+            return ctypes, DATA_BLOB, protect, unprotect
+        except Exception:
+            return None
+
+    @classmethod
+    def _dpapi_protect(cls, data: bytes) -> bytes:
+        dpapi = cls._dpapi()
+        if dpapi is None:
+            return data
+        ctypes, DATA_BLOB, CryptProtectData, _ = dpapi
+        try:
             in_blob = DATA_BLOB(len(data), ctypes.cast(ctypes.create_string_buffer(data), ctypes.POINTER(ctypes.c_char)))
             out_blob = DATA_BLOB()
             if CryptProtectData(ctypes.byref(in_blob), None, None, None, None, 0, ctypes.byref(out_blob)) == 0:
                 raise OSError("CryptProtectData failed")
-            try:
-                buf = ctypes.string_at(out_blob.pbData, out_blob.cbData)
-                ctypes.windll.kernel32.LocalFree(out_blob.pbData)
-                return buf
-            finally:
-                pass
+            buf = ctypes.string_at(out_blob.pbData, out_blob.cbData)
+            ctypes.windll.kernel32.LocalFree(out_blob.pbData)
+            return buf
         except Exception:
             return data
 
-    @staticmethod
-    def _dpapi_unprotect(data: bytes) -> bytes:
+    @classmethod
+    def _dpapi_unprotect(cls, data: bytes) -> bytes:
+        dpapi = cls._dpapi()
+        if dpapi is None:
+            return data
+        ctypes, DATA_BLOB, _, CryptUnprotectData = dpapi
         try:
-            import ctypes
-            import ctypes.wintypes as wt
-            class DATA_BLOB(ctypes.Structure):
-                _fields_ = [("cbData", wt.DWORD), ("pbData", ctypes.POINTER(ctypes.c_char))]
-            CryptUnprotectData = ctypes.windll.crypt32.CryptUnprotectData
             in_blob = DATA_BLOB(len(data), ctypes.cast(ctypes.create_string_buffer(data), ctypes.POINTER(ctypes.c_char)))
             out_blob = DATA_BLOB()
             if CryptUnprotectData(ctypes.byref(in_blob), None, None, None, None, 0, ctypes.byref(out_blob)) == 0:
                 raise OSError("CryptUnprotectData failed")
-            try:
-                buf = ctypes.string_at(out_blob.pbData, out_blob.cbData)
-                ctypes.windll.kernel32.LocalFree(out_blob.pbData)
-                return buf
-            finally:
-                pass
+            buf = ctypes.string_at(out_blob.pbData, out_blob.cbData)
+            ctypes.windll.kernel32.LocalFree(out_blob.pbData)
+            return buf
         except Exception:
             return data
 
@@ -169,13 +280,24 @@ class ConfigManager:
         except Exception:
             return b""
 
-    @staticmethod
-    def _xor(data: bytes, key: bytes) -> bytes:
-        if not key:
+    # key -> per-position 256-entry XOR translation tables, built once per key
+    _xor_tables: dict = {}
+
+    @classmethod
+    def _xor(cls, data: bytes, key: bytes) -> bytes:
+        if not key or not data:
             return data
-        out = bytearray(len(data))
-        for i, b in enumerate(data):
-            out[i] = b ^ key[i % len(key)]
+        tables = cls._xor_tables.get(key)
+        if tables is None:
+            tables = tuple(bytes(i ^ kb for i in range(256)) for kb in key)
+            cls._xor_tables[key] = tables
+        # XOR each key-position subsequence via bytes.translate: all per-byte
+        # work happens in C, and the tables are reused for the session since
+        # the key is constant.
+        kl = len(key)
+        out = bytearray(data)
+        for p, tbl in enumerate(tables):
+            out[p::kl] = data[p::kl].translate(tbl)
         return bytes(out)
 
     @classmethod
@@ -189,7 +311,7 @@ class ConfigManager:
             else:
                 raw = cls._xor(enc, cls._get_xor_key())
             try:
-                return json.loads(raw.decode("utf-8"))
+                return _json_loads(raw)
             except Exception:
                 return {}
         except Exception as e:
@@ -199,7 +321,7 @@ class ConfigManager:
     @classmethod
     def _save_encrypted(cls, secrets: dict) -> None:
         try:
-            payload = json.dumps(secrets).encode("utf-8")
+            payload = _json_dumps_bytes(secrets)
             if os.name == "nt":
                 out = cls._dpapi_protect(payload)
             else:
@@ -207,27 +329,101 @@ class ConfigManager:
             cls.SECRETS_FILE.write_bytes(out)
         except Exception as e:
             LOGGER.warning(f"Failed to write secrets.bin: {e}")
+        with cls._cache_lock:
+            cls._cache = None
+
+    @classmethod
+    def _files_stamp(cls) -> Tuple[int, int]:
+        def _mtime_ns(p: Path) -> int:
+            try:
+                return p.stat().st_mtime_ns
+            except OSError:
+                return 0
+        return (_mtime_ns(cls.CONFIG_FILE), _mtime_ns(cls.SECRETS_FILE))
 
     @classmethod
     def load(cls) -> dict:
-        data: dict = {}
-        # Load non-sensitive data from JSON (if any)
-        if cls.CONFIG_FILE.exists():
+        stamp = cls._files_stamp()
+        with cls._cache_lock:
+            if cls._cache is not None and stamp == cls._cache_stamp:
+                return copy.copy(cls._cache)
+            data = cls._load_uncached()
+            cls._cache = copy.copy(data)
+            cls._cache_stamp = stamp
+            return data
+
+    @classmethod
+    def settings_cache(cls) -> dict:
+        """The in-memory non-sensitive settings dict, loaded once from disk.
+
+        Mutate it directly and call schedule_flush() (coalesced) or flush()
+        (immediate) to persist.
+        """
+        with cls._cache_lock:
+            if not cls._cache_loaded:
+                if cls.CONFIG_FILE.exists():
+                    try:
+                        cls.cache = _json_loads(cls.CONFIG_FILE.read_bytes())
+                    except Exception as e:  # pragma: no cover - corruption is rare
+                        LOGGER.warning(f"Failed to read config.json: {e}")
+                        cls.cache = {}
+                cls._cache_loaded = True
+            return cls.cache
+
+    @classmethod
+    def flush(cls) -> None:
+        with cls._cache_lock:
+            if not cls._cache_loaded:
+                return
             try:
-                with open(cls.CONFIG_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except Exception as e:  # pragma: no cover - corruption is rare
-                LOGGER.warning(f"Failed to read config.json: {e}")
-                data = {}
-        # Load sensitive values
+                payload = _json_dumps_bytes(cls.cache)
+                try:
+                    if cls.CONFIG_FILE.read_bytes() == payload:
+                        return  # no-op save; don't touch mtime
+                except OSError:
+                    pass
+                # Atomic replace: a crash mid-flush can't truncate the config
+                tmp = cls.CONFIG_FILE.with_suffix(".json.tmp")
+                tmp.write_bytes(payload)
+                os.replace(tmp, cls.CONFIG_FILE)
+            except Exception as e:  # pragma: no cover
+                LOGGER.error(f"Failed to write config.json: {e}")
+            cls._cache = None
+
+    @classmethod
+    def schedule_flush(cls, delay_ms: int = 500) -> None:
+        # Coalesce bursts of settings writes; fall back to an immediate
+        # flush when no Qt event loop is around to run the timer.
+        if QtCore is not None and QtCore.QCoreApplication.instance() is not None:
+            if cls._flush_timer is None:
+                timer = QtCore.QTimer()
+                timer.setSingleShot(True)
+                timer.timeout.connect(cls.flush)
+                cls._flush_timer = timer
+            cls._flush_timer.start(delay_ms)
+        else:
+            cls.flush()
+
+    @classmethod
+    def _load_uncached(cls) -> dict:
+        # Non-sensitive data comes from the in-memory settings mirror
+        data: dict = dict(cls.settings_cache())
+        # Load sensitive values. Keyring calls can each take 100+ ms (IPC to
+        # the OS credential store), so fetch all keys in parallel; this only
+        # runs on a cache miss.
         enc_secrets = cls._load_encrypted()
-        for key in cls.SENSITIVE_KEYS:
-            val = None
-            if keyring is not None:
+        kr_vals: dict = {}
+        if keyring is not None:
+            def _kr_get(key: str) -> Optional[str]:
                 try:
-                    val = keyring.get_password(cls.SERVICE, key)
+                    return keyring.get_password(cls.SERVICE, key)
                 except Exception as e:  # pragma: no cover
                     LOGGER.warning(f"Keyring get failed for {key}: {e}")
+                    return None
+            with ThreadPoolExecutor(max_workers=len(cls.SENSITIVE_KEYS)) as ex:
+                kr_vals = dict(zip(cls.SENSITIVE_KEYS, ex.map(_kr_get, cls.SENSITIVE_KEYS)))
+        for key in cls.SENSITIVE_KEYS:
+            val = kr_vals.get(key)
             if val is None:
                 val = enc_secrets.get(key)
             if val is None:
@@ -241,47 +437,60 @@ class ConfigManager:
     def save(cls, values: dict) -> None:
         # Save sensitive values to keyring when possible; else encrypted file
         to_file: dict = {}
-        secrets_to_write = cls._load_encrypted()
-        changed_secrets = False
+        sensitive: dict = {}
         for k, v in values.items():
             if k in cls.SENSITIVE_KEYS:
-                stored = False
-                if keyring is not None:
-                    try:
-                        if v is None or v == "":
-                            keyring.delete_password(cls.SERVICE, k)  # type: ignore
-                        else:
-                            keyring.set_password(cls.SERVICE, k, str(v))  # type: ignore
-                        stored = True
-                    except Exception as e:  # pragma: no cover
-                        LOGGER.warning(f"Keyring set failed for {k}: {e}")
-                if not stored:
-                    # encrypted fallback
+                sensitive[k] = v
+            else:
+                to_file[k] = v
+
+        # Dispatch all keyring writes in parallel: each is a ~100-200 ms
+        # credential-store round-trip. Failed keys fall back to the
+        # encrypted file, same as before.
+        fallback: List[Tuple[str, object]] = []
+        if sensitive and keyring is not None:
+            def _kr_set(item: Tuple[str, object]):
+                k, v = item
+                try:
                     if v is None or v == "":
-                        if k in secrets_to_write:
-                            del secrets_to_write[k]
-                            changed_secrets = True
+                        keyring.delete_password(cls.SERVICE, k)  # type: ignore
                     else:
-                        secrets_to_write[k] = str(v)
+                        keyring.set_password(cls.SERVICE, k, str(v))  # type: ignore
+                    return None
+                except Exception as e:  # pragma: no cover
+                    LOGGER.warning(f"Keyring set failed for {k}: {e}")
+                    return item
+            with ThreadPoolExecutor(max_workers=len(sensitive)) as ex:
+                fallback = [it for it in ex.map(_kr_set, sensitive.items()) if it is not None]
+        elif sensitive:
+            fallback = list(sensitive.items())
+
+        if fallback:
+            secrets_to_write = cls._load_encrypted()
+            changed_secrets = False
+            for k, v in fallback:
+                if v is None or v == "":
+                    if k in secrets_to_write:
+                        del secrets_to_write[k]
                         changed_secrets = True
-            else:
-                to_file[k] = v
-        if changed_secrets:
-            cls._save_encrypted(secrets_to_write)
-        # Merge with existing non-sensitive settings in the file
-        existing = {}
-        if cls.CONFIG_FILE.exists():
-            try:
-                with open(cls.CONFIG_FILE, "r", encoding="utf-8") as f:
-                    existing = json.load(f)
-            except Exception:
-                existing = {}
-        existing.update(to_file)
-        try:
-            with open(cls.CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(existing, f, indent=2)
-        except Exception as e:  # pragma: no cover
-            LOGGER.error(f"Failed to write config.json: {e}")
+                else:
+                    secrets_to_write[k] = str(v)
+                    changed_secrets = True
+            if changed_secrets:
+                cls._save_encrypted(secrets_to_write)
+
+        # Merge non-sensitive settings into the in-memory mirror; skip the
+        # write entirely when nothing would change.
+        if to_file:
+            cfg = cls.settings_cache()
+            if any(cfg.get(k) != v for k, v in to_file.items()):
+                cfg.update(to_file)
+                cls.flush()
+        with cls._cache_lock:
+            cls._cache = None
+        if sensitive:
+            # Credentials changed; cached clients must re-authenticate.
+            TwitterClient._clients.clear()
 
     @classmethod
     def get(cls, key: str, default: Optional[str] = None) -> Optional[str]:
@@ -289,9 +498,11 @@ class ConfigManager:
 
     @classmethod
     def set(cls, key: str, value: Optional[str]) -> None:
-        data = cls.load()
-        data[key] = value
-        cls.save(data)
+        # Write just this key: save() routes a sensitive key to one keyring
+        # call and a non-sensitive key to the settings mirror. Round-tripping
+        # the whole load()ed dict here used to rewrite every credential per
+        # single-key update.
+        cls.save({key: value})
 
     @classmethod
     def add_recent_file(cls, path: str, limit: int = 10) -> None:
@@ -307,9 +518,8 @@ class ConfigManager:
         lst = data.get("recent_files")
         if not isinstance(lst, list):
             lst = []
-        # Normalize and deduplicate; move new path to front
-        lst = [str(x) for x in lst if isinstance(x, str)]
-        lst = [x for x in lst if x != p]
+        # Normalize and deduplicate in one pass; move new path to front
+        lst = [x for x in lst if isinstance(x, str) and x != p]
         lst.insert(0, p)
         if limit > 0:
             lst = lst[:limit]
@@ -329,51 +539,138 @@ class ConfigManager:
 
 # --------------- Text importers ---------------
 
+_TEXT_READ_CHUNK = 65536
+
+
 def _read_text_file(path: Path) -> str:
-    if chardet is not None:
-        try:
-            raw = path.read_bytes()
-            enc = chardet.detect(raw).get("encoding") or "utf-8"
-            return raw.decode(enc, errors="replace")
-        except Exception:
-            return path.read_text(encoding="utf-8", errors="replace")
-    else:
+    # Stream in 64 KiB buffers through an incremental decoder so peak memory
+    # stays near one buffer plus the decoded result, instead of holding the
+    # raw bytes and the full str at once. Sniffing the first buffer is as
+    # accurate as the whole file and bounds detection cost.
+    try:
+        with open(path, "rb") as f:
+            first = f.read(_TEXT_READ_CHUNK)
+            enc = "utf-8"
+            if first.startswith(codecs.BOM_UTF8):
+                enc = "utf-8-sig"
+            elif first:
+                # UTF-8 fast path: most files decode cleanly, so probe the
+                # first buffer with a strict incremental decoder (tolerant of
+                # a multi-byte char cut at the buffer edge) before paying for
+                # statistical detection.
+                try:
+                    codecs.getincrementaldecoder("utf-8")().decode(first)
+                except UnicodeDecodeError:
+                    chardet = _chardet()
+                    if chardet is not None:
+                        try:
+                            enc = chardet.detect(first).get("encoding") or "utf-8"
+                        except Exception:
+                            enc = "utf-8"
+            try:
+                decoder = codecs.getincrementaldecoder(enc)(errors="replace")
+            except LookupError:
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            parts = [decoder.decode(first)]
+            while True:
+                buf = f.read(_TEXT_READ_CHUNK)
+                if not buf:
+                    break
+                parts.append(decoder.decode(buf))
+            parts.append(decoder.decode(b"", final=True))
+            return "".join(parts)
+    except Exception:
         return path.read_text(encoding="utf-8", errors="replace")
 
 
 def _read_json_file(path: Path) -> str:
-    with open(path, "r", encoding="utf-8", errors="replace") as f:
-        try:
-            data = json.load(f)
-            return json.dumps(data, ensure_ascii=False, indent=2)
-        except Exception:
-            # Fallback: as text
-            return _read_text_file(path)
+    try:
+        data = _json_loads(path.read_bytes())
+        return _json_dumps_bytes(data, indent=True).decode("utf-8")
+    except Exception:
+        # Fallback: as text
+        return _read_text_file(path)
 
 
 def _read_csv_file(path: Path) -> str:
     try:
         with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
-            reader = csv.reader(f)
-            output = io.StringIO()
-            for row in reader:
-                output.write("\t".join(row) + "\n")
-            return output.getvalue()
+            buf = io.StringIO()
+            writer = csv.writer(buf, delimiter="\t", lineterminator="\n")
+            writer.writerows(csv.reader(f))
+        return buf.getvalue()
     except Exception:
         return _read_text_file(path)
 
 
-def _read_pdf_file(path: Path) -> Optional[str]:  # optional
+def _read_pdf_file_pymupdf(path: Path) -> Optional[str]:  # optional
+    try:
+        import fitz  # type: ignore  # PyMuPDF
+    except Exception:
+        return None
+    try:
+        doc = fitz.open(str(path))
+        try:
+            return "\n".join(page.get_text("text") for page in doc)
+        finally:
+            doc.close()
+    except Exception:
+        return None
+
+
+def _read_pdf_file_pdfminer(path: Path) -> Optional[str]:  # optional
     try:
         from pdfminer.high_level import extract_text  # type: ignore
+        from pdfminer.layout import LAParams  # type: ignore
+    except Exception:
+        return None
+    try:
+        # Explicit margins keep pdfminer's layout analysis from pathological
+        # grouping on dense/graphics-heavy pages (documented multi-minute
+        # worst cases with the defaults).
+        laparams = LAParams(char_margin=2.0, line_margin=0.5, word_margin=0.1)
+        return extract_text(str(path), laparams=laparams)
+    except Exception:
+        return None
+
+
+def _read_pdf_file_pypdfium2(path: Path) -> Optional[str]:  # optional
+    try:
+        import pypdfium2  # type: ignore
     except Exception:
         return None
     try:
-        return extract_text(str(path))
+        pdf = pypdfium2.PdfDocument(str(path))
+        try:
+            return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+        finally:
+            pdf.close()
     except Exception:
         return None
 
 
+_PDF_BACKENDS = {
+    "pymupdf": _read_pdf_file_pymupdf,
+    "pdfminer": _read_pdf_file_pdfminer,
+    "pypdfium2": _read_pdf_file_pypdfium2,
+}
+
+
+def _read_pdf_file(path: Path) -> Optional[str]:  # optional
+    # PyMuPDF extracts text an order of magnitude faster than pdfminer, so
+    # prefer it, then pdfminer, then pypdfium2. Set TWEETYPY_PDF_BACKEND to
+    # force one (e.g. to avoid AGPL-licensed PyMuPDF).
+    forced = os.environ.get("TWEETYPY_PDF_BACKEND", "").lower()
+    if forced:
+        reader = _PDF_BACKENDS.get(forced)
+        return reader(path) if reader else None
+    for reader in (_read_pdf_file_pymupdf, _read_pdf_file_pdfminer, _read_pdf_file_pypdfium2):
+        text = reader(path)
+        if text is not None:
+            return text
+    return None
+
+
 def _read_docx_file(path: Path) -> Optional[str]:  # optional
     try:
         import docx  # type: ignore
@@ -388,13 +685,17 @@ def _read_docx_file(path: Path) -> Optional[str]:  # optional
 
 def _read_html_file(path: Path) -> Optional[str]:  # optional
     try:
-        from bs4 import BeautifulSoup  # type: ignore
+        from bs4 import BeautifulSoup, FeatureNotFound  # type: ignore
     except Exception:
         return None
     try:
         html = path.read_text(encoding="utf-8", errors="replace")
-        soup = BeautifulSoup(html, "lxml") if "lxml" else BeautifulSoup(html, "html.parser")
-        return soup.get_text("\n")
+        try:
+            # lxml is much faster than the stdlib parser when installed
+            soup = BeautifulSoup(html, "lxml")
+        except FeatureNotFound:
+            soup = BeautifulSoup(html, "html.parser")
+        return soup.get_text("\n", strip=True)
     except Exception:
         return None
 
@@ -440,29 +741,27 @@ def suffix_length(n_total: int) -> int:
 
 def greedy_split_within_limit(text: str, limit: int) -> List[str]:
     # Greedily take chunks up to limit, prefer breaking at whitespace.
+    # Not replaceable by textwrap.wrap: it expands tabs, merges across
+    # newlines and chunks differently, which changes tweet boundaries.
     chunks: List[str] = []
     i = 0
     N = len(text)
-    ws = re.compile(r"\s")
     while i < N:
         end = min(i + limit, N)
-        chunk = text[i:end]
         if end < N:
-            # try break at last whitespace within chunk
-            last_ws = -1
-            for m in ws.finditer(chunk):
-                last_ws = m.start()
-            if last_ws > 0:
-                end = i + last_ws
-                chunk = text[i:end]
+            # try break at last whitespace in [i, end); bounded rfind scans
+            # the window in C without slicing out a chunk string first
+            last_ws = max(text.rfind(" ", i, end), text.rfind("\t", i, end), text.rfind("\n", i, end))
+            if last_ws > i:
+                end = last_ws
         # strip leading/trailing spaces to avoid awkward boundaries
-        cleaned = chunk.strip()
+        cleaned = text[i:end].strip()
         if cleaned:
             chunks.append(cleaned)
-        # advance index; skip any whitespace between chunks
-        i = end
-        while i < N and text[i].isspace():
-            i += 1
+        # advance index; skip any whitespace between chunks in one C-level
+        # search instead of a per-character Python loop
+        m = _NON_WS_RE.search(text, end)
+        i = m.start() if m else N
         if i == end and end == N and not cleaned:
             break
         # Hard-split for pathological case where no progress
@@ -473,56 +772,44 @@ def greedy_split_within_limit(text: str, limit: int) -> List[str]:
 
 def split_text_into_tweets(text: str, max_len: int = DEFAULT_MAX_TWEET_LEN) -> List[str]:
     # Normalize newlines; keep other whitespace
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = _LINE_BREAK_RE.sub("\n", text)
     text = text.strip()
     if not text:
         return []
+    # Fast path: drafts that fit a single tweet (the common case while
+    # typing) skip the splitter and stabilization loop entirely.
+    if len(text) + suffix_length(1) <= max_len:
+        return [f"{text} 1/1"]
+
+    def _split(body_limit: int) -> List[str]:
+        # Prefer whitespace breaks; hard-split any single chunk longer than
+        # body_limit (e.g. a giant word or URL).
+        bodies: List[str] = []
+        for c in greedy_split_within_limit(text, body_limit):
+            L = len(c)
+            if L <= body_limit:
+                bodies.append(c)
+            else:
+                bodies.extend(c[i:i + body_limit] for i in range(0, L, body_limit))
+        return bodies
 
-    # Initial estimate assumes <= 9 tweets → 1 digit
+    # Initial estimate assumes <= 9 tweets → 1 digit. The suffix width only
+    # changes when the digit count of the total changes (9→10, 99→100, …),
+    # so re-split only in that case instead of looping to a fixed point.
     n_est = 9
-    prev_count = -1
-    for _ in range(10):  # should stabilize quickly
+    final_bodies: List[str] = []
+    for _ in range(10):  # digit count grows monotonically; converges fast
         reserved = suffix_length(n_est)
         body_limit = max_len - reserved
         if body_limit <= 0:
             raise ValueError("Max tweet length too small to accommodate suffix")
-        bodies = []
-        # We need to also deal with single words longer than body_limit: do hard-split
-        # Use a pass that prefers whitespace, but if any segment > body_limit without whitespace, hard-split
-        tmp_chunks = greedy_split_within_limit(text, body_limit)
-        for c in tmp_chunks:
-            if len(c) <= body_limit:
-                bodies.append(c)
-            else:
-                # hard split
-                start = 0
-                while start < len(c):
-                    bodies.append(c[start:start + body_limit])
-                    start += body_limit
-        n_new = len(bodies)
-        if n_new == prev_count:
-            n_est = n_new
+        final_bodies = _split(body_limit)
+        n_new = max(1, len(final_bodies))
+        if digits(n_new) == digits(n_est):
             break
-        prev_count = n_new
-        # Update estimate to new count; ensures suffix accounts for correct digits
-        n_est = max(1, n_new)
-        # if digits changed (e.g., 9->10), loop will recompute body_limit and resplit
-    # Final suffix append
-    n_total = max(1, prev_count)
-    reserved = suffix_length(n_total)
-    body_limit = max_len - reserved
-    final_bodies: List[str] = []
-    tmp_chunks = greedy_split_within_limit(text, body_limit)
-    for c in tmp_chunks:
-        if len(c) <= body_limit:
-            final_bodies.append(c)
-        else:
-            start = 0
-            while start < len(c):
-                final_bodies.append(c[start:start + body_limit])
-                start += body_limit
-    n_total = len(final_bodies)
-    tweets = [f"{final_bodies[i]} {i+1}/{n_total}" for i in range(n_total)]
+        n_est = n_new
+    suffix = f"/{len(final_bodies)}"
+    tweets = [f"{body} {i}{suffix}" for i, body in enumerate(final_bodies, 1)]
     return tweets
 
 
@@ -537,8 +824,25 @@ class TwitterCredentials:
 
 
 class TwitterClient:
+    # Constructed clients cached by credential tuple: __init__ performs a
+    # network verify_credentials() round-trip that should happen once per
+    # credential set, not once per CLI run step or button click. Cleared by
+    # ConfigManager.save() when any sensitive key changes.
+    _clients: dict = {}
+
+    @classmethod
+    def get_client(cls, creds: Optional[TwitterCredentials] = None) -> "TwitterClient":
+        c = creds or cls._load_creds()
+        key = (c.api_key, c.api_secret_key, c.access_token, c.access_token_secret)
+        client = cls._clients.get(key)
+        if client is None:
+            client = cls(c)
+            cls._clients[key] = client
+        return client
+
     def __init__(self, creds: Optional[TwitterCredentials] = None) -> None:
         self.creds = creds or self._load_creds()
+        tweepy = _tweepy()
         self.available = tweepy is not None and self._creds_complete()
         self.api = None
         if self.available:
@@ -567,7 +871,8 @@ class TwitterClient:
         c = self.creds
         return bool(c.api_key and c.api_secret_key and c.access_token and c.access_token_secret)
 
-    def _load_creds(self) -> TwitterCredentials:
+    @staticmethod
+    def _load_creds() -> TwitterCredentials:
         data = ConfigManager.load()
         return TwitterCredentials(
             api_key=data.get("api_key"),
@@ -576,7 +881,12 @@ class TwitterClient:
             access_token_secret=data.get("access_token_secret"),
         )
 
-    def post_thread(self, tweets: List[str], simulate: bool = False) -> Tuple[bool, Optional[str]]:
+    def post_thread(
+        self,
+        tweets: List[str],
+        simulate: bool = False,
+        progress: Optional[Callable[[int, str], None]] = None,
+    ) -> Tuple[bool, Optional[str]]:
         if not tweets:
             return False, "No tweets to post."
         if simulate or not self.available or self.api is None:
@@ -588,6 +898,8 @@ class TwitterClient:
             first = self.api.update_status(status=tweets[0])
             last_id = first.id
             LOGGER.info(f"Posted 1/{len(tweets)}: id={last_id}")
+            if progress:
+                progress(1, tweets[0])
             for i, t in enumerate(tweets[1:], start=2):
                 status = self.api.update_status(
                     status=t,
@@ -596,6 +908,8 @@ class TwitterClient:
                 )
                 last_id = status.id
                 LOGGER.info(f"Posted {i}/{len(tweets)}: id={last_id}")
+                if progress:
+                    progress(i, t)
             return True, None
         except Exception as e:  # pragma: no cover - network dependent
             LOGGER.error(f"Failed to post thread: {e}")
@@ -616,7 +930,7 @@ def run_cli(args: argparse.Namespace) -> int:
         LOGGER.info("No content found to post.")
         return 0
     simulate = not args.post
-    client = TwitterClient()
+    client = TwitterClient.get_client()
     ok, err = client.post_thread(tweets, simulate=simulate)
     if ok:
         LOGGER.info("Done.")
@@ -630,6 +944,95 @@ def run_cli(args: argparse.Namespace) -> int:
 
 if QtWidgets:
 
+    class _AutosaveSignals(QtCore.QObject):
+        finished = QtCore.Signal(str, str)  # path, error message ("" if none)
+
+
+    class _AutosaveTask(QtCore.QRunnable):
+        """Writes a session snapshot off the GUI thread, atomically."""
+
+        def __init__(self, path: Path, payload: bytes):
+            super().__init__()
+            self.signals = _AutosaveSignals()
+            self._path = path
+            self._payload = payload
+
+        def run(self):
+            try:
+                tmp = self._path.with_suffix(".json.tmp")
+                tmp.write_bytes(self._payload)
+                os.replace(tmp, self._path)
+                self.signals.finished.emit(str(self._path), "")
+            except Exception as e:
+                self.signals.finished.emit(str(self._path), str(e))
+
+
+    class _FileLoadSignals(QtCore.QObject):
+        finished = QtCore.Signal(str, str, str)  # path, text, error ("" if none)
+
+
+    class _FileLoadTask(QtCore.QRunnable):
+        """Imports a file off the GUI thread; PDF parsing can take seconds."""
+
+        def __init__(self, path: str):
+            super().__init__()
+            self.signals = _FileLoadSignals()
+            self._path = path
+
+        def run(self):
+            try:
+                text = read_file_to_text(self._path)
+                self.signals.finished.emit(self._path, text, "")
+            except Exception as e:
+                self.signals.finished.emit(self._path, "", str(e))
+
+
+    class _PostSignals(QtCore.QObject):
+        progress = QtCore.Signal(int, str)   # 1-based index, tweet text
+        finished = QtCore.Signal(bool, str)  # ok, error message ("" if none)
+
+
+    class _PostTask(QtCore.QRunnable):
+        """Posts a thread on a pool thread so the GUI event loop stays live."""
+
+        def __init__(self, client: TwitterClient, tweets: List[str], simulate: bool):
+            super().__init__()
+            self.signals = _PostSignals()
+            self._client = client
+            self._tweets = tweets
+            self._simulate = simulate
+
+        def run(self):
+            try:
+                ok, err = self._client.post_thread(
+                    self._tweets, simulate=self._simulate,
+                    progress=self.signals.progress.emit,
+                )
+            except Exception as e:  # pragma: no cover - network dependent
+                ok, err = False, str(e)
+            self.signals.finished.emit(ok, err or "")
+
+
+    class _TestSignals(QtCore.QObject):
+        finished = QtCore.Signal(bool)  # client.available
+
+
+    class _TestTask(QtCore.QRunnable):
+        """Verifies credentials on a pool thread; auth is a network round trip."""
+
+        def __init__(self, creds: TwitterCredentials):
+            super().__init__()
+            self.signals = _TestSignals()
+            self._creds = creds
+
+        def run(self):
+            try:
+                ok = TwitterClient(self._creds).available
+            except Exception:  # pragma: no cover - network dependent
+                ok = False
+            self.signals.finished.emit(ok)
+
+
     class SettingsDialog(QtWidgets.QDialog):
         def __init__(self, parent=None):
             super().__init__(parent)
@@ -672,6 +1075,8 @@ if QtWidgets:
             self.save_btn.clicked.connect(self.on_save)
             self.cancel_btn.clicked.connect(self.reject)
 
+            self._test_task: Optional[_TestTask] = None
+
         def on_test(self):
             values = {
                 "api_key": self.api_key.text().strip(),
@@ -685,8 +1090,17 @@ if QtWidgets:
                 access_token=values["access_token"],
                 access_token_secret=values["access_token_secret"],
             )
-            client = TwitterClient(temp_creds)
-            if client.available:
+            self.test_btn.setEnabled(False)
+            self.test_btn.setText("Testing…")
+            self._test_task = _TestTask(temp_creds)
+            self._test_task.signals.finished.connect(self._on_test_done)
+            QtCore.QThreadPool.globalInstance().start(self._test_task)
+
+        def _on_test_done(self, ok: bool):
+            self._test_task = None
+            self.test_btn.setEnabled(True)
+            self.test_btn.setText("Test Connection")
+            if ok:
                 QtWidgets.QMessageBox.information(self, "Connection", "Authentication successful.")
             else:
                 QtWidgets.QMessageBox.warning(self, "Connection", "Authentication failed or Tweepy not available.")
@@ -710,6 +1124,22 @@ if QtWidgets:
             self.resize(1000, 700)
 
             self._current_session_path: Optional[Path] = None
+            # Qt window/splitter blobs live in QSettings (native binary);
+            # config.json keeps only app-level prefs
+            self._qsettings = QtCore.QSettings(APP_NAME, APP_NAME)
+            self._post_task: Optional[_PostTask] = None
+            self._post_simulate = False
+            self._autosave_task: Optional[_AutosaveTask] = None
+            self._autosave_inflight = False
+            self._load_task: Optional[_FileLoadTask] = None
+            # Session text LRU so arrow-keying through history doesn't
+            # re-read and re-parse the same files; validated by mtime.
+            self._session_cache: "OrderedDict[Path, Tuple[int, str]]" = OrderedDict()
+            self._last_tweets: List[str] = []
+            self._last_preview_text: Optional[str] = None
+            self._last_saved_hash = b""
+            # (dir mtime_ns, sorted entries) memo shared by history readers
+            self._history_scan: Optional[Tuple[int, List[Tuple[str, float]]]] = None
             self._history_dir = get_app_dir() / "History"
             self._history_dir.mkdir(parents=True, exist_ok=True)
 
@@ -803,6 +1233,19 @@ if QtWidgets:
             self._build_menu()
             self._build_toolbar()
 
+            # Coalesce preview refreshes: splitting the whole draft is O(N),
+            # so run it once per ~150 ms of typing idle instead of per key
+            self._preview_timer = QtCore.QTimer(self)
+            self._preview_timer.setSingleShot(True)
+            self._preview_timer.setInterval(150)
+            self._preview_timer.timeout.connect(self.update_preview)
+
+            # Coalesce autosaves: one write per idle window, not per keystroke
+            self._autosave_timer = QtCore.QTimer(self)
+            self._autosave_timer.setSingleShot(True)
+            self._autosave_timer.setInterval(750)
+            self._autosave_timer.timeout.connect(self._save_session_auto)
+
             # Signals
             self.editor.textChanged.connect(self._on_editor_changed)
 
@@ -868,39 +1311,83 @@ if QtWidgets:
             tb.addAction(self.act_settings)
 
         def update_preview(self):
-            text = self.editor.toPlainText()
-            tweets = split_text_into_tweets(text) if text.strip() else []
-            self.preview.clear()
-            for t in tweets:
-                item = QtWidgets.QListWidgetItem(t)
-                self.preview.addItem(item)
+            # The document tracks its own length; characterCount() avoids
+            # materializing the full text just for the label (-1 drops the
+            # trailing block terminator). toPlainText() runs only when there
+            # is content to split.
+            doc_chars = max(0, self.editor.document().characterCount() - 1)
+            text = self.editor.toPlainText() if doc_chars else ""
+            # No-op refreshes (focus-triggered signals, timer firing with no
+            # effective edit) skip the splitter entirely
+            if text == self._last_preview_text:
+                return
+            self._last_preview_text = text
+            s = text.strip()
+            if not s:
+                tweets = []
+            elif len(s) + suffix_length(1) <= DEFAULT_MAX_TWEET_LEN and "\r" not in text:
+                # Single-tweet fast path for short drafts (the common case
+                # while typing); produces exactly what the splitter would.
+                tweets = [f"{s} 1/1"]
+            else:
+                tweets = split_text_into_tweets(text)
+            self._apply_preview_diff(tweets)
             # Update status
-            self.status_chars.setText(f"Chars: {len(text)}")
+            self.status_chars.setText(f"Chars: {doc_chars}")
             self.status_est.setText(f"Tweets: {len(tweets)}")
 
+        def _apply_preview_diff(self, tweets: List[str]) -> None:
+            # Rewrite only the items that changed instead of clearing and
+            # rebuilding the whole list; steady-state typing touches the
+            # tail of the thread, so most rows stay untouched.
+            old = self._last_tweets
+            if tweets == old:
+                return
+            self.preview.setUpdatesEnabled(False)
+            try:
+                common = min(len(old), len(tweets))
+                for i in range(common):
+                    if old[i] != tweets[i]:
+                        self.preview.item(i).setText(tweets[i])
+                if len(tweets) > len(old):
+                    self.preview.addItems(tweets[len(old):])
+                else:
+                    for i in range(len(old) - 1, len(tweets) - 1, -1):
+                        self.preview.takeItem(i)
+            finally:
+                self.preview.setUpdatesEnabled(True)
+            self._last_tweets = tweets
+
         def _first_phrase(self, text: str) -> Optional[str]:
             s = text.strip()
             if not s:
                 return None
-            m = re.search(r"[\.!?]", s)
+            m = _RE_SENT_END.search(s)
             phrase = s if not m else s[: m.end()]
-            phrase = re.sub(r"\s+", " ", phrase).strip()
+            phrase = _RE_WS.sub(" ", phrase).strip()
             return phrase or None
 
         def _session_filename(self, text: str) -> Optional[str]:
             phrase = self._first_phrase(text)
             if not phrase:
                 return None
-            safe = re.sub(r"[^A-Za-z0-9 _-]", "", phrase)[:60].strip()
+            safe = _RE_UNSAFE.sub("", phrase)[:60].strip()
             if not safe:
                 safe = "session"
             base = safe
+            # One directory scan into a set instead of an exists() stat per
+            # candidate suffix
+            try:
+                with os.scandir(self._history_dir) as it:
+                    existing = {e.name for e in it if e.name.endswith(".json")}
+            except OSError:
+                existing = set()
+            name = f"{base}.json"
             i = 1
-            while True:
-                name = f"{base}.json" if i == 1 else f"{base} ({i}).json"
-                if not (self._history_dir / name).exists():
-                    return name
+            while name in existing:
                 i += 1
+                name = f"{base} ({i}).json"
+            return name
 
         def _save_session_auto(self):
             # If user has an explicitly saved/loaded file, don't autosave to history
@@ -915,53 +1402,118 @@ if QtWidgets:
                 if not fname:
                     return  # don't save until first phrase exists
                 self._current_session_path = self._history_dir / fname
+            # Don't rewrite identical content (e.g. the timer fired after a
+            # focus change with no edits); hashing is far cheaper than the
+            # serialize+write it skips.
+            h = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+            if h == self._last_saved_hash:
+                return
+            # Serialize and hand off to a pool thread; overlapping writes to
+            # the same file are avoided by retrying after the current one.
+            if self._autosave_inflight:
+                self._autosave_timer.start()
+                return
             data = {
                 "text": text,
                 "timestamp": QtCore.QDateTime.currentDateTime().toString(QtCore.Qt.ISODate),
             }
+            payload = _json_dumps_bytes(data)
+            self._last_saved_hash = h
+            self._autosave_inflight = True
+            task = _AutosaveTask(self._current_session_path, payload)
+            task.signals.finished.connect(self._on_autosave_finished)
+            self._autosave_task = task  # keep signal emitter alive
+            QtCore.QThreadPool.globalInstance().start(task)
+
+        def _on_autosave_finished(self, path: str, err: str):
+            self._autosave_inflight = False
+            self._autosave_task = None
+            if err:
+                LOGGER.warning(f"Auto-save failed: {err}")
+                self._last_saved_hash = b""  # retry on next change
+                return
+            self._session_cache.pop(Path(path), None)
+            self._history_scan = None
+            # Refresh history UI so autosaves are visible immediately
+            self._reload_history()
+            # Select the just-saved session in the list (if present)
             try:
-                self._current_session_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-                # Refresh history UI so autosaves are visible immediately
-                self._reload_history()
-                # Select the just-saved session in the list (if present)
-                try:
-                    name = self._current_session_path.name
-                    matches = self.list_history.findItems(name, QtCore.Qt.MatchExactly)
-                    if matches:
-                        self.list_history.setCurrentItem(matches[0])
-                except Exception:
-                    pass
-            except Exception as e:
-                LOGGER.warning(f"Auto-save failed: {e}")
+                matches = self.list_history.findItems(Path(path).name, QtCore.Qt.MatchExactly)
+                if matches:
+                    self.list_history.setCurrentItem(matches[0])
+            except Exception:
+                pass
 
         def _on_editor_changed(self):
-            self.update_preview()
-            self._save_session_auto()
+            self._preview_timer.start()
+            self._autosave_timer.start()
+
+        def _scan_history(self) -> List[Tuple[str, float]]:
+            """Session (name, mtime) pairs, newest first.
+
+            Memoized on the history directory's own mtime_ns so back-to-back
+            callers (startup runs _load_last_session then _reload_history)
+            share one scandir pass. os.scandir hands back mtimes from the
+            directory walk itself, avoiding one stat() syscall per file.
+            """
+            try:
+                dir_stamp = os.stat(self._history_dir).st_mtime_ns
+            except OSError:
+                return []
+            if self._history_scan is not None and self._history_scan[0] == dir_stamp:
+                return self._history_scan[1]
+            with os.scandir(self._history_dir) as it:
+                entries = [
+                    (e.name, e.stat().st_mtime)
+                    for e in it
+                    if e.name.endswith(".json") and e.is_file(follow_symlinks=False)
+                ]
+            entries.sort(key=lambda x: x[1], reverse=True)
+            self._history_scan = (dir_stamp, entries)
+            return entries
 
         def _reload_history(self):
             self.list_history.clear()
             try:
                 # 1) Autosaved sessions from History directory
-                session_files = sorted(self._history_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-                for f in session_files:
-                    item = QtWidgets.QListWidgetItem(f.name)
-                    item.setData(QtCore.Qt.UserRole, {"type": "session", "path": str(f)})
-                    self.list_history.addItem(item)
+                entries = self._scan_history()
                 # 2) Recently opened/saved files from config.json (if they still exist)
-                recent_files = ConfigManager.get_recent_files()
-                for p in recent_files:
+                recent: List[Path] = []
+                for p in ConfigManager.get_recent_files():
                     try:
                         fp = Path(p)
                         if fp.exists() and fp.is_file():
-                            display = fp.name
-                            item = QtWidgets.QListWidgetItem(display)
-                            item.setData(QtCore.Qt.UserRole, {"type": "file", "path": str(fp)})
-                            self.list_history.addItem(item)
+                            recent.append(fp)
                     except Exception:
                         continue
+                # Insert all rows in one bulk call (one model update instead
+                # of a rowsInserted signal per row), then attach per-item data
+                self.list_history.addItems([name for name, _ in entries] + [fp.name for fp in recent])
+                row = 0
+                for name, _mtime in entries:
+                    self.list_history.item(row).setData(QtCore.Qt.UserRole, {"type": "session", "path": str(self._history_dir / name)})
+                    row += 1
+                for fp in recent:
+                    self.list_history.item(row).setData(QtCore.Qt.UserRole, {"type": "file", "path": str(fp)})
+                    row += 1
             except Exception as e:
                 LOGGER.warning(f"History load failed: {e}")
 
+        def _session_text(self, path: Path) -> str:
+            """Session text via an mtime-validated LRU (max 64 entries)."""
+            mtime = path.stat().st_mtime_ns
+            hit = self._session_cache.get(path)
+            if hit is not None and hit[0] == mtime:
+                self._session_cache.move_to_end(path)
+                return hit[1]
+            obj = _json_loads(path.read_bytes())
+            text = obj.get("text", "")
+            self._session_cache[path] = (mtime, text)
+            self._session_cache.move_to_end(path)
+            while len(self._session_cache) > 64:
+                self._session_cache.popitem(last=False)
+            return text
+
         def _on_history_selected(self):
             items = self.list_history.selectedItems()
             if not items:
@@ -973,8 +1525,7 @@ if QtWidgets:
             try:
                 if itype == "session":
                     path = Path(meta.get("path", ""))
-                    obj = json.loads(path.read_text(encoding="utf-8"))
-                    self.preview_session.setPlainText(obj.get("text", ""))
+                    self.preview_session.setPlainText(self._session_text(path))
                 elif itype == "file":
                     path = Path(meta.get("path", ""))
                     if path.exists() and path.is_file():
@@ -984,10 +1535,8 @@ if QtWidgets:
                         self.preview_session.setPlainText("File not found.")
                 else:
                     # Fallback to previous behavior assuming session name
-                    name = item.text()
-                    path = self._history_dir / name
-                    obj = json.loads(path.read_text(encoding="utf-8"))
-                    self.preview_session.setPlainText(obj.get("text", ""))
+                    path = self._history_dir / item.text()
+                    self.preview_session.setPlainText(self._session_text(path))
             except Exception as e:
                 self.preview_session.setPlainText(f"Failed to load preview: {e}")
 
@@ -997,7 +1546,7 @@ if QtWidgets:
             try:
                 if itype == "session":
                     path = Path(meta.get("path", ""))
-                    obj = json.loads(path.read_text(encoding="utf-8"))
+                    obj = _json_loads(path.read_bytes())
                     self.editor.setPlainText(obj.get("text", ""))
                     self._current_session_path = path
                     # Clear explicit file so autosave returns to history mode
@@ -1021,7 +1570,7 @@ if QtWidgets:
                     # Fallback to previous behavior assuming session name
                     name = item.text()
                     path = self._history_dir / name
-                    obj = json.loads(path.read_text(encoding="utf-8"))
+                    obj = _json_loads(path.read_bytes())
                     self.editor.setPlainText(obj.get("text", ""))
                     self._current_session_path = path
                     ConfigManager.set("last_file", None)
@@ -1049,99 +1598,98 @@ if QtWidgets:
                         pass
             # Otherwise fallback to last autosaved session
             try:
-                files = sorted(self._history_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-                if files:
-                    self._current_session_path = files[0]
-                    obj = json.loads(files[0].read_text(encoding="utf-8"))
+                entries = self._scan_history()
+                if entries:
+                    newest = self._history_dir / entries[0][0]
+                    self._current_session_path = newest
+                    obj = _json_loads(newest.read_bytes())
                     self.editor.setPlainText(obj.get("text", ""))
             except Exception as e:
                 LOGGER.warning(f"Load last session failed: {e}")
 
         def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+            # Flush any autosave still pending in the debounce window and
+            # wait briefly for in-flight background writes to land.
+            self._autosave_timer.stop()
             self._save_session_auto()
+            QtCore.QThreadPool.globalInstance().waitForDone(2000)
             self._save_window_state()
             return super().closeEvent(event)
 
         def _on_copy_toggle(self, checked: bool):
-            # Save preference immediately to config
-            settings_path = ConfigManager.CONFIG_FILE
-            cfg = {}
-            if settings_path.exists():
-                try:
-                    cfg = json.loads(settings_path.read_text(encoding="utf-8"))
-                except Exception:
-                    cfg = {}
-            cfg["copy_preview_enabled"] = bool(checked)
-            try:
-                settings_path.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
-            except Exception as e:
-                LOGGER.warning(f"Failed to persist copy_preview_enabled: {e}")
+            # Mutate the in-memory settings and let the coalesced flush write
+            ConfigManager.settings_cache()["copy_preview_enabled"] = bool(checked)
+            ConfigManager.schedule_flush()
+
+        _QT_STATE_KEYS = ("win_geometry", "win_state", "right_panel_state", "history_splitter_state")
 
         def _save_window_state(self):
-            settings_path = ConfigManager.CONFIG_FILE
-            cfg = {}
-            if settings_path.exists():
-                try:
-                    cfg = json.loads(settings_path.read_text(encoding="utf-8"))
-                except Exception:
-                    cfg = {}
-            cfg["win_geometry"] = bytes(self.saveGeometry()).hex()
-            cfg["win_state"] = bytes(self.saveState()).hex()
+            s = self._qsettings
+            s.setValue("win_geometry", self.saveGeometry())
+            s.setValue("win_state", self.saveState())
             # Save splitter states
             try:
-                cfg["right_panel_state"] = bytes(self.right_panel.saveState()).hex()
+                s.setValue("right_panel_state", self.right_panel.saveState())
             except Exception:
                 pass
             try:
-                cfg["history_splitter_state"] = bytes(self.split_hist.saveState()).hex()
+                s.setValue("history_splitter_state", self.split_hist.saveState())
             except Exception:
                 pass
+            cfg = ConfigManager.settings_cache()
+            # Drop legacy hex blobs now that QSettings owns this state
+            for k in self._QT_STATE_KEYS:
+                cfg.pop(k, None)
             # Save copy-to-clipboard checkbox state
             try:
                 cfg["copy_preview_enabled"] = bool(self.chk_copy_preview.isChecked())
             except Exception:
                 pass
-            try:
-                settings_path.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
-            except Exception as e:
-                LOGGER.warning(f"Failed to save window state: {e}")
+            # Called on close; write now rather than waiting on the timer
+            ConfigManager.flush()
+
+        def _qt_state_blob(self, key: str):
+            # QSettings first; fall back to the legacy hex blob in config.json
+            val = self._qsettings.value(key)
+            if val:
+                return val
+            legacy = ConfigManager.settings_cache().get(key)
+            if legacy:
+                try:
+                    return bytes.fromhex(legacy)
+                except Exception:
+                    return None
+            return None
 
         def _restore_window_state(self):
-            settings_path = ConfigManager.CONFIG_FILE
-            if not settings_path.exists():
-                return
-            try:
-                cfg = json.loads(settings_path.read_text(encoding="utf-8"))
-            except Exception:
-                return
-            geo = cfg.get("win_geometry")
-            st = cfg.get("win_state")
+            geo = self._qt_state_blob("win_geometry")
+            st = self._qt_state_blob("win_state")
             if geo:
                 try:
-                    self.restoreGeometry(bytes.fromhex(geo))
+                    self.restoreGeometry(geo)
                 except Exception:
                     pass
             if st:
                 try:
-                    self.restoreState(bytes.fromhex(st))
+                    self.restoreState(st)
                 except Exception:
                     pass
             # Restore splitters
-            rp = cfg.get("right_panel_state")
+            rp = self._qt_state_blob("right_panel_state")
             if rp:
                 try:
-                    self.right_panel.restoreState(bytes.fromhex(rp))
+                    self.right_panel.restoreState(rp)
                 except Exception:
                     pass
-            hs = cfg.get("history_splitter_state")
+            hs = self._qt_state_blob("history_splitter_state")
             if hs:
                 try:
-                    self.split_hist.restoreState(bytes.fromhex(hs))
+                    self.split_hist.restoreState(hs)
                 except Exception:
                     pass
             # Restore copy-to-clipboard preference (default True if not present)
             try:
-                val = cfg.get("copy_preview_enabled")
+                val = ConfigManager.settings_cache().get("copy_preview_enabled")
                 if isinstance(val, bool):
                     self.chk_copy_preview.setChecked(val)
                 else:
@@ -1156,19 +1704,34 @@ if QtWidgets:
 
         def on_open(self):
             file, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Open Draft", str(Path.home()), "Text Files (*.txt *.md *.rst *.log *.json *.csv *.tsv *.py *.pdf *.docx *.html);;All Files (*)")
-            if file:
-                try:
-                    txt = read_file_to_text(file)
-                    self.editor.setPlainText(txt)
-                    ConfigManager.set("last_file", file)
-                    ConfigManager.add_recent_file(file)
-                    # Stop autosaving to history when explicit file is in use
-                    self._current_session_path = None
-                    self.update_preview()
-                    # Refresh history to include/open reflect the file immediately
-                    self._reload_history()
-                except Exception as e:
-                    QtWidgets.QMessageBox.critical(self, "Open", str(e))
+            if not file:
+                return
+            # Parse off the GUI thread; a big PDF/DOCX import otherwise
+            # freezes the window for its whole extraction time
+            self.act_open.setEnabled(False)
+            self.act_import.setEnabled(False)
+            self.statusBar().showMessage(f"Loading {Path(file).name}…")
+            task = _FileLoadTask(file)
+            task.signals.finished.connect(self._on_file_loaded)
+            self._load_task = task  # keep signal emitter alive while running
+            QtCore.QThreadPool.globalInstance().start(task)
+
+        def _on_file_loaded(self, file: str, txt: str, err: str):
+            self._load_task = None
+            self.act_open.setEnabled(True)
+            self.act_import.setEnabled(True)
+            self.statusBar().clearMessage()
+            if err:
+                QtWidgets.QMessageBox.critical(self, "Open", err)
+                return
+            self.editor.setPlainText(txt)
+            ConfigManager.set("last_file", file)
+            ConfigManager.add_recent_file(file)
+            # Stop autosaving to history when explicit file is in use
+            self._current_session_path = None
+            self.update_preview()
+            # Refresh history to include/open reflect the file immediately
+            self._reload_history()
 
         def on_save(self):
             file, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save Draft", str(Path.home()), "Text Files (*.txt);;All Files (*)")
@@ -1198,11 +1761,31 @@ if QtWidgets:
             ret = QtWidgets.QMessageBox.question(self, "Confirm Post", f"Post {len(tweets)} tweets as a thread?\n\nPreview:\n\n{preview}")
             if ret != QtWidgets.QMessageBox.Yes:
                 return
-            client = TwitterClient()
+            # get_client() reuses the cached, already-verified client for the
+            # active credentials; ConfigManager.save() drops it when the
+            # Settings dialog stores new keys.
+            client = TwitterClient.get_client()
             simulate = not client.available
-            ok, err = client.post_thread(tweets, simulate=simulate)
+            # Run the uploads on a pool thread; each update_status is a
+            # network round-trip and would otherwise freeze the UI.
+            self.act_post.setEnabled(False)
+            self._post_simulate = simulate
+            task = _PostTask(client, tweets, simulate)
+            task.signals.progress.connect(self._on_post_progress)
+            task.signals.finished.connect(self._on_post_finished)
+            self._post_task = task  # keep signal emitter alive while running
+            self.statusBar().showMessage("Posting thread…" if not simulate else "Simulating post…")
+            QtCore.QThreadPool.globalInstance().start(task)
+
+        def _on_post_progress(self, i: int, tweet: str):
+            self.statusBar().showMessage(f"Posted tweet {i}…", 2000)
+
+        def _on_post_finished(self, ok: bool, err: str):
+            self._post_task = None
+            self.act_post.setEnabled(True)
+            self.statusBar().clearMessage()
             if ok:
-                QtWidgets.QMessageBox.information(self, "Post", "Thread posted successfully." if not simulate else "Simulated posting complete.")
+                QtWidgets.QMessageBox.information(self, "Post", "Thread posted successfully." if not self._post_simulate else "Simulated posting complete.")
             else:
                 QtWidgets.QMessageBox.critical(self, "Post", f"Failed: {err}")
 